@@ -16,85 +16,336 @@ Usage:
     # Dry-run (show what would be written)
     python3 tools/dolt-export.py --dry-run
 
+    # Re-export, skipping packages unchanged since the last run
+    python3 tools/dolt-export.py --output /tmp/exported --incremental
+
     # Verify round-trip against source
     python3 tools/dolt-export.py --output /tmp/exported --verify-against /path/to/packages/
 
+    # Query a running `dolt sql-server` over one persistent connection
+    python3 tools/dolt-export.py --output /tmp/exported --server 127.0.0.1:3306
+
 Requires:
     - Dolt CLI on PATH (uses `dolt sql -q -r json`)
     - CWD must be inside a Dolt database directory (or pass --doltdb)
+    - PyMySQL (pip3 install pymysql) — only for --server
+    - orjson (pip3 install orjson) — optional, faster JSON; falls back to json
+    - ijson (pip3 install ijson) — optional, parses query results as they stream
+      (used only with its C yajl2 backend)
 """
 
 import argparse
+import filecmp
+import functools
 import hashlib
 import json
 import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence
+
+try:
+    import ijson
+    # ijson's pure-Python backend is far slower than buffering the output
+    # and parsing it with orjson/json; only stream with a C backend
+    if ijson.backend not in ("yajl2_c", "yajl2_cffi"):
+        ijson = None
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Runs one SQL statement (with %s params) and returns its rows as dicts
+QueryFn = Callable[..., list[dict]]
+
+_print_lock = threading.Lock()
+
+
+def _print(*args: Any, **kwargs: Any) -> None:
+    """print() that keeps lines from worker threads from interleaving."""
+    with _print_lock:
+        print(*args, **kwargs)
 
 
 # ---------------------------------------------------------------------------
 # Dolt query helpers
 # ---------------------------------------------------------------------------
 
-def dolt_query(sql: str, doltdb: Path) -> list[dict]:
-    """Execute SQL and return rows as list of dicts."""
+def sql_str(val: str) -> str:
+    """Escape a string for SQL (single-quote escaping)."""
+    escaped = val.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def dolt_query(sql: str, doltdb: Path, params: Sequence[str] = ()) -> list[dict]:
+    """Execute SQL and return rows as list of dicts.
+
+    The dolt CLI has no bind parameters, so %s placeholders are filled
+    with escaped string literals from params.
+    """
+    if params:
+        sql = sql % tuple(sql_str(p) for p in params)
+    if ijson:
+        return _dolt_query_streaming(sql, doltdb)
     result = subprocess.run(
         ["dolt", "sql", "-q", sql, "-r", "json"],
-        capture_output=True, text=True, cwd=str(doltdb),
+        capture_output=True, cwd=str(doltdb),
     )
     if result.returncode != 0:
-        print(f"✗ SQL error: {result.stderr}", file=sys.stderr)
+        stderr = result.stderr.decode("utf-8", "replace")
+        print(f"✗ SQL error: {stderr}", file=sys.stderr)
         return []
     try:
-        data = json.loads(result.stdout)
+        # Both parsers take the raw stdout bytes; no intermediate str copy
+        data = orjson.loads(result.stdout) if orjson else json.loads(result.stdout)
         # dolt sql -r json returns {"rows": [...]}
         return data.get("rows", [])
     except json.JSONDecodeError:
         return []
 
 
+def _dolt_query_streaming(sql: str, doltdb: Path) -> list[dict]:
+    """dolt_query that decodes rows as they arrive on the dolt stdout pipe.
+
+    The raw JSON payload is never buffered whole, so peak memory is the
+    parsed rows rather than rows plus the serialized result.
+    """
+    with tempfile.TemporaryFile() as err, subprocess.Popen(
+        ["dolt", "sql", "-q", sql, "-r", "json"],
+        stdout=subprocess.PIPE, stderr=err, cwd=str(doltdb),
+    ) as proc:
+        try:
+            # dolt sql -r json returns {"rows": [...]}
+            rows = list(ijson.items(proc.stdout, "rows.item", use_float=True))
+        except ijson.JSONError:
+            rows = []
+        proc.stdout.close()
+        if proc.wait() != 0:
+            err.seek(0)
+            stderr = err.read().decode("utf-8", "replace")
+            print(f"✗ SQL error: {stderr}", file=sys.stderr)
+            return []
+    return rows
+
+
+def _split_address(address: str) -> tuple[str, int]:
+    """Split HOST[:PORT] (or [IPV6][:PORT]) into host and port (default 3306)."""
+    if address.startswith("[") and "]" in address:
+        host, _, rest = address[1:].partition("]")
+        port = rest[1:] if rest.startswith(":") else rest  # junk is rejected below
+    elif address.count(":") == 1:
+        host, _, port = address.partition(":")
+    else:
+        host, port = address, ""  # plain host name, or a bare IPv6 literal
+    if port and not port.isdigit():
+        print(f"✗ Invalid port in --server {address!r}", file=sys.stderr)
+        sys.exit(1)
+    return host or "127.0.0.1", int(port or 3306)
+
+
+def connect_server(address: str, database: str, user: str) -> Any:
+    """Open a PyMySQL connection to a running `dolt sql-server`."""
+    try:
+        import pymysql
+        import pymysql.cursors
+    except ImportError:
+        print("✗ --server requires PyMySQL (pip3 install pymysql)", file=sys.stderr)
+        sys.exit(1)
+    host, port = _split_address(address)
+    try:
+        return pymysql.connect(
+            host=host,
+            port=port,
+            user=user,
+            password=os.environ.get("DOLT_PASSWORD", ""),
+            database=database,
+            charset="utf8mb4",
+            cursorclass=pymysql.cursors.DictCursor,
+        )
+    except pymysql.err.Error as e:
+        print(f"✗ Cannot connect to dolt sql-server at {address}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def server_query(sql: str, conn: Any, params: Sequence[str] = ()) -> list[dict]:
+    """Execute SQL over a sql-server connection and return rows as dicts."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute(sql, tuple(params) or None)
+            return list(cur.fetchall())
+    except conn.Error as e:
+        print(f"✗ SQL error: {e}", file=sys.stderr)
+        return []
+
+
+# Columns the exporter actually reads; everything else stays in Dolt
+PACKAGE_COLUMNS = ("id, name, version, description, author, license, tags, "
+                   "install_scope, variables, options")
+FILE_COLUMNS = "package_id, dest_path, content, sha256, file_type"
+DEP_COLUMNS = "package_id, dep_name, dep_spec"
+
+
+def fetch_packages(pkg_ids: Optional[list[str]], query: QueryFn,
+                   counts_only: bool = False) -> dict[str, dict]:
+    """Fetch rows for all requested packages with one query per table.
+
+    Returns {pkg_id: {"package": row, "files": [...], "deps": [...],
+    "file_count": n}} for every ID found in the database, in id order;
+    files and deps keep their ORDER BY. pkg_ids=None fetches every package
+    without a separate ID-listing query. With counts_only (dry runs) file
+    contents and deps are not fetched at all; only file_count is filled in.
+    """
+    if pkg_ids is None:
+        pkg_where = file_where = ""
+        params: Sequence[str] = ()
+    else:
+        in_list = ", ".join(["%s"] * len(pkg_ids))
+        pkg_where = f" WHERE id IN ({in_list})"
+        file_where = f" WHERE package_id IN ({in_list})"
+        params = pkg_ids
+
+    pkgs = query(
+        f"SELECT {PACKAGE_COLUMNS} FROM packages{pkg_where} ORDER BY id;",
+        params=params,
+    )
+    catalog = {p["id"]: {"package": p, "files": [], "deps": [], "file_count": 0}
+               for p in pkgs}
+
+    if counts_only:
+        counts = query(
+            f"SELECT package_id, COUNT(*) AS file_count FROM package_files"
+            f"{file_where} GROUP BY package_id;", params=params
+        )
+        for c in counts:
+            if c["package_id"] in catalog:
+                catalog[c["package_id"]]["file_count"] = int(c["file_count"])
+        return catalog
+
+    files = query(
+        f"SELECT {FILE_COLUMNS} FROM package_files{file_where} "
+        f"ORDER BY package_id, dest_path;", params=params
+    )
+    for f in files:
+        if f["package_id"] in catalog:
+            catalog[f["package_id"]]["files"].append(f)
+            catalog[f["package_id"]]["file_count"] += 1
+
+    deps = query(
+        f"SELECT {DEP_COLUMNS} FROM package_deps{file_where} "
+        f"ORDER BY package_id, dep_name;", params=params
+    )
+    for d in deps:
+        if d["package_id"] in catalog:
+            catalog[d["package_id"]]["deps"].append(d)
+
+    return catalog
+
+
 # ---------------------------------------------------------------------------
 # YAML rendering (no PyYAML dependency for export)
 # ---------------------------------------------------------------------------
 
+# Characters that force a scalar into single quotes
+_YAML_SPECIAL_RE = re.compile(r"[:{}\[\]#&*!|>'\"%@`]")
+
+
 def render_yaml_value(val: Any, indent: int = 0) -> str:
     """Render a value as YAML."""
+    out: list[str] = []
+    _emit_yaml(val, indent, out)
+    return "".join(out)
+
+
+def _emit_yaml(val: Any, indent: int, out: list[str]) -> None:
+    """Append the YAML fragments for val to out (one join at the top)."""
+    emit = _YAML_EMITTERS.get(type(val)) or _emitter_for(type(val))
+    emit(val, indent, out)
+
+
+def _emit_null(val: None, indent: int, out: list[str]) -> None:
+    out.append("null")
+
+
+def _emit_bool(val: bool, indent: int, out: list[str]) -> None:
+    out.append("true" if val else "false")
+
+
+def _emit_number(val: Any, indent: int, out: list[str]) -> None:
+    out.append(str(val))
+
+
+def _emit_str(val: str, indent: int, out: list[str]) -> None:
+    # Use block scalar for multi-line, quoted for special chars
+    if "\n" in val:
+        prefix = "  " * indent
+        lines = val.rstrip("\n").split("\n")
+        out.append(">\n" + "\n".join(f"{prefix}  {line}" for line in lines))
+    elif _YAML_SPECIAL_RE.search(val):
+        escaped = val.replace("'", "''")
+        out.append(f"'{escaped}'")
+    else:
+        out.append(val)
+
+
+def _emit_list(val: list, indent: int, out: list[str]) -> None:
+    if not val:
+        out.append("[]")
+        return
     prefix = "  " * indent
-    if val is None:
-        return "null"
-    if isinstance(val, bool):
-        return "true" if val else "false"
-    if isinstance(val, (int, float)):
-        return str(val)
-    if isinstance(val, str):
-        # Use block scalar for multi-line, quoted for special chars
-        if "\n" in val:
-            lines = val.rstrip("\n").split("\n")
-            return ">\n" + "\n".join(f"{prefix}  {line}" for line in lines)
-        if any(c in val for c in ":{}[]#&*!|>'\"%@`"):
-            return f"'{val}'"
-        return val
-    if isinstance(val, list):
-        if not val:
-            return "[]"
-        lines = []
-        for item in val:
-            lines.append(f"\n{prefix}- {render_yaml_value(item, indent + 1)}")
-        return "".join(lines)
-    if isinstance(val, dict):
-        if not val:
-            return "{}"
-        lines = []
-        for k, v in val.items():
-            rendered = render_yaml_value(v, indent + 1)
-            if isinstance(v, (dict, list)) and v:
-                lines.append(f"\n{prefix}{k}:{rendered}")
-            else:
-                lines.append(f"\n{prefix}{k}: {rendered}")
-        return "".join(lines)
-    return str(val)
+    for item in val:
+        out.append(f"\n{prefix}- ")
+        _emit_yaml(item, indent + 1, out)
+
+
+def _emit_dict(val: dict, indent: int, out: list[str]) -> None:
+    if not val:
+        out.append("{}")
+        return
+    prefix = "  " * indent
+    for k, v in val.items():
+        if isinstance(v, (dict, list)) and v:
+            out.append(f"\n{prefix}{k}:")
+        else:
+            out.append(f"\n{prefix}{k}: ")
+        _emit_yaml(v, indent + 1, out)
+
+
+def _emit_other(val: Any, indent: int, out: list[str]) -> None:
+    out.append(str(val))
+
+
+# Exact-type dispatch: one dict lookup per node instead of an isinstance chain
+_YAML_EMITTERS: dict[type, Callable[[Any, int, list[str]], None]] = {
+    type(None): _emit_null,
+    bool: _emit_bool,
+    int: _emit_number,
+    float: _emit_number,
+    str: _emit_str,
+    list: _emit_list,
+    dict: _emit_dict,
+}
+
+
+def _emitter_for(tp: type) -> Callable[[Any, int, list[str]], None]:
+    """Emitter for a type not in _YAML_EMITTERS (e.g. a dict subclass)."""
+    for base in tp.__mro__:
+        if base in _YAML_EMITTERS:
+            return _YAML_EMITTERS[base]
+    return _emit_other
+
+
+def _as_definitions(entries: dict) -> dict:
+    """Normalize variables/options so every entry is a mapping of fields."""
+    return {name: d if isinstance(d, dict) else {"value": d}
+            for name, d in entries.items()}
 
 
 def build_manifest_yaml(pkg: dict, files: list[dict], deps: list[dict]) -> str:
@@ -163,14 +414,7 @@ def build_manifest_yaml(pkg: dict, files: list[dict], deps: list[dict]) -> str:
                 variables = None
     if variables:
         lines.append("# Token substitution (Tier 1 package)")
-        lines.append("variables:")
-        for var_name, var_def in variables.items():
-            lines.append(f"  {var_name}:")
-            if isinstance(var_def, dict):
-                for k, v in var_def.items():
-                    lines.append(f"    {k}: {v}")
-            else:
-                lines.append(f"    value: {var_def}")
+        lines.append("variables:" + render_yaml_value(_as_definitions(variables), 1))
 
     # Install scope
     install_scope = pkg.get("install_scope", "any")
@@ -191,15 +435,7 @@ def build_manifest_yaml(pkg: dict, files: list[dict], deps: list[dict]) -> str:
     if options:
         lines.append("")
         lines.append("# Install-time options")
-        lines.append("options:")
-        for opt_name, opt_def in options.items():
-            lines.append(f"  {opt_name}:")
-            if isinstance(opt_def, dict):
-                for k, v in opt_def.items():
-                    val = "true" if v is True else "false" if v is False else str(v)
-                    lines.append(f"    {k}: {val}")
-            else:
-                lines.append(f"    value: {opt_def}")
+        lines.append("options:" + render_yaml_value(_as_definitions(options), 1))
 
     # Requirements
     if deps:
@@ -219,6 +455,11 @@ def build_manifest_yaml(pkg: dict, files: list[dict], deps: list[dict]) -> str:
 
 def build_plugin_json(pkg: dict, files: list[dict]) -> str:
     """Reconstruct plugin.json from database rows."""
+    return plugin_json_bytes(pkg, files).decode("utf-8")
+
+
+def plugin_json_bytes(pkg: dict, files: list[dict]) -> bytes:
+    """build_plugin_json as UTF-8 bytes, ready to write without re-encoding."""
     tags = pkg.get("tags", "")
     keywords = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
 
@@ -257,85 +498,213 @@ def build_plugin_json(pkg: dict, files: list[dict]) -> str:
     if skills:
         plugin["skills"] = sorted(skills)
 
-    return json.dumps(plugin, indent=2, ensure_ascii=False) + "\n"
+    if orjson:
+        return orjson.dumps(
+            plugin, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(plugin, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
 # Export logic
 # ---------------------------------------------------------------------------
 
-def export_package(pkg_id: str, output_dir: Path, doltdb: Path,
-                   dry_run: bool = False) -> dict:
-    """Export a single package to the output directory. Returns stats."""
-    # Query package
-    pkgs = dolt_query(
-        f"SELECT * FROM packages WHERE id = '{pkg_id}';", doltdb
-    )
-    if not pkgs:
-        print(f"✗ Package not found: {pkg_id}", file=sys.stderr)
-        return {"error": f"not found: {pkg_id}"}
+# Bump when the rendered layout changes so stale stamps stop matching
+EXPORT_STAMP_VERSION = 1
 
-    pkg = pkgs[0]
 
-    # Query files
-    files = dolt_query(
-        f"SELECT * FROM package_files WHERE package_id = '{pkg_id}' "
-        f"ORDER BY dest_path;", doltdb
+def export_key(entry: dict) -> str:
+    """Content key for a package's rows; equal keys export identical trees."""
+    payload = json.dumps(
+        [EXPORT_STAMP_VERSION, entry["package"], entry["files"], entry["deps"]],
+        sort_keys=True, ensure_ascii=False, default=str,
     )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _stamp_path(pkg_dir: Path) -> Optional[Path]:
+    """Where the export key for pkg_dir is recorded (outside the export).
+
+    None when there is no usable cache location (no $XDG_CACHE_HOME and no
+    home directory); exports then just run without stamps.
+    """
+    try:
+        cache = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    except (RuntimeError, KeyError):
+        return None
+    name = hashlib.sha256(str(pkg_dir.resolve()).encode("utf-8")).hexdigest()
+    return cache / "sc-dolt-export" / f"{name}.key"
+
+
+def _read_stamp(stamp: Path) -> Optional[str]:
+    try:
+        return stamp.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+# Stamps are housekeeping: an unusable cache directory must never fail an
+# export, so OS errors here are ignored
+
+def _clear_stamp(stamp: Path) -> None:
+    try:
+        stamp.unlink()
+    except OSError:
+        pass
 
-    # Query deps
-    deps = dolt_query(
-        f"SELECT * FROM package_deps WHERE package_id = '{pkg_id}' "
-        f"ORDER BY dep_name;", doltdb
-    )
+
+def _write_stamp(stamp: Path, key: str) -> None:
+    try:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        tmp = stamp.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(key, encoding="utf-8")
+        os.replace(tmp, stamp)
+    except OSError:
+        pass
+
+
+def _write_file(path: str | Path, data: bytes) -> None:
+    """Write data with a bare open/write/close.
+
+    Path.write_bytes goes through a buffered file object that probes the
+    descriptor (fstat, isatty) on every open; small files are dominated by
+    that overhead.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(path, flags, 0o666)
+    except FileExistsError:
+        # Replace rather than truncate: the old inode may be hard-linked
+        # into another package by --link-duplicates
+        os.unlink(path)
+        fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _link_duplicate(src: Optional[str], dst: str) -> bool:
+    """Hard-link dst to an already exported file with identical content."""
+    if src is None:
+        return False
+    try:
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        # e.g. EXDEV or a filesystem without hard links; caller writes instead
+        return False
+    return True
+
+
+def _sha256_hex(data: bytes) -> str:
+    """SHA-256 hex digest; hashlib drops the GIL for large buffers."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def export_package(entry: dict, output_dir: Path,
+                   dry_run: bool = False,
+                   hash_pool: Optional[Executor] = None,
+                   incremental: bool = False,
+                   links: Optional[dict[str, str]] = None) -> dict:
+    """Export one fetched catalog entry to the output directory. Returns stats.
+
+    Works purely from the rows already in entry; no SQL is issued here.
+
+    When hash_pool is given, SHA-256 verification of the written files is
+    spread across its threads. With incremental, a package whose rows are
+    unchanged since its last clean export into pkg_dir is skipped and its
+    stats carry "unchanged". links (sha256 -> first path written, shared
+    across packages) turns content-identical files into hard links.
+    """
+    pkg = entry["package"]
+    pkg_id = pkg["id"]
+    files = entry["files"]
+    deps = entry["deps"]
 
     pkg_dir = output_dir / pkg_id
     stats = {"id": pkg_id, "files_written": 0, "sha_ok": 0, "sha_fail": 0}
 
     if dry_run:
-        print(f"\n  Package: {pkg_id} v{pkg['version']}")
-        print(f"  Would write {len(files)} content files + manifest.yaml + plugin.json")
+        # Printed by the caller, in package order
+        stats["dry_run"] = (f"\n  Package: {pkg_id} v{pkg['version']}\n"
+                            f"  Would write {entry['file_count']} content files "
+                            f"+ manifest.yaml + plugin.json")
         return stats
 
+    stamp = _stamp_path(pkg_dir)
+    if incremental and stamp:
+        key = export_key(entry)
+        if pkg_dir.is_dir() and _read_stamp(stamp) == key:
+            stats["unchanged"] = True
+            return stats
+
+    # Whatever we write from here on no longer matches the old key, whether
+    # or not this run is incremental; only a clean export re-stamps it
+    if stamp:
+        _clear_stamp(stamp)
+
     # Create directory
     pkg_dir.mkdir(parents=True, exist_ok=True)
 
     # Write manifest.yaml (reconstructed)
     manifest_content = build_manifest_yaml(pkg, files, deps)
-    (pkg_dir / "manifest.yaml").write_text(manifest_content, encoding="utf-8")
+    _write_file(pkg_dir / "manifest.yaml", manifest_content.encode("utf-8"))
     stats["files_written"] += 1
 
+    # Plain string paths in the per-file loop; Path objects cost an
+    # allocation and parse per join
+    out = os.fspath(pkg_dir)
+    dests = [os.path.join(out, f["dest_path"]) for f in files]
+
+    # Create each distinct parent directory once, shallowest first
+    parents = {os.path.dirname(dst) for dst in dests}
+    for d in sorted(parents, key=len):
+        os.makedirs(d, exist_ok=True)
+
+    # Encode once; the same bytes are hashed and written
+    encoded = [f.get("content", "").encode("utf-8") for f in files]
+    hashes = hash_pool.map(_sha256_hex, encoded) if hash_pool else map(_sha256_hex, encoded)
+
     # Write content files
     has_plugin_json = False
-    for f in files:
+    for f, file_path, data, actual_sha in zip(files, dests, encoded, hashes):
         dest_path = f["dest_path"]
-        content = f.get("content", "")
-        expected_sha = f.get("sha256", "")
 
-        file_path = pkg_dir / dest_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        if links is None or not _link_duplicate(links.get(actual_sha), file_path):
+            _write_file(file_path, data)
+            # Registered only once fully written, so no one links a partial file
+            if links is not None:
+                links.setdefault(actual_sha, file_path)
         stats["files_written"] += 1
 
-        # Verify SHA-256
-        actual_sha = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        # Verify SHA-256 of exactly the bytes on disk
+        expected_sha = f.get("sha256", "")
         if expected_sha and actual_sha == expected_sha:
             stats["sha_ok"] += 1
         elif expected_sha:
             stats["sha_fail"] += 1
-            print(f"  ⚠ SHA mismatch: {dest_path}", file=sys.stderr)
+            _print(f"  ⚠ SHA mismatch: {dest_path}", file=sys.stderr)
 
         if dest_path == ".claude-plugin/plugin.json":
             has_plugin_json = True
 
     # If no plugin.json was stored as a file, reconstruct it
     if not has_plugin_json:
-        plugin_content = build_plugin_json(pkg, files)
+        # orjson already produces bytes; skip the str round-trip
+        plugin_content = plugin_json_bytes(pkg, files)
         plugin_dir = pkg_dir / ".claude-plugin"
         plugin_dir.mkdir(parents=True, exist_ok=True)
-        (plugin_dir / "plugin.json").write_text(plugin_content, encoding="utf-8")
+        _write_file(plugin_dir / "plugin.json", plugin_content)
         stats["files_written"] += 1
 
+    # Only a clean export may be skipped next time
+    if incremental and stamp and not stats["sha_fail"]:
+        _write_stamp(stamp, key)
+
     return stats
 
 
@@ -343,7 +712,30 @@ def export_package(pkg_id: str, output_dir: Path, doltdb: Path,
 # Verification
 # ---------------------------------------------------------------------------
 
-def verify_against_source(exported_dir: Path, source_dir: Path, pkg_id: str) -> dict:
+def _compare_file(export_file: Path, source_file: Path) -> str:
+    """Classify an exported file against its source counterpart.
+
+    Returns one of "match", "diff", "binary" or "export_only". Only files
+    that differ byte-wise and can't be decoded as UTF-8 are "binary";
+    byte-identical files are a "match" whatever their encoding.
+    """
+    if not source_file.exists():
+        return "export_only"
+    # Byte-identical files (the common case) are settled by filecmp in
+    # fixed-size chunks without decoding either side
+    if filecmp.cmp(export_file, source_file, shallow=False):
+        return "match"
+    # Otherwise compare as text so newline-only differences still match
+    try:
+        e_content = export_file.read_text(encoding="utf-8")
+        s_content = source_file.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return "binary"
+    return "match" if e_content == s_content else "diff"
+
+
+def verify_against_source(exported_dir: Path, source_dir: Path, pkg_id: str,
+                          pool: Optional[Executor] = None) -> dict:
     """Compare exported files against the source marketplace directory."""
     export_pkg = exported_dir / pkg_id
     source_pkg = source_dir / pkg_id
@@ -354,26 +746,26 @@ def verify_against_source(exported_dir: Path, source_dir: Path, pkg_id: str) ->
     results = {"matched": 0, "differed": 0, "export_only": 0, "source_only": 0, "details": []}
 
     # Compare exported files against source
+    rels: list[Path] = []
     for root, _, filenames in os.walk(export_pkg):
         for fname in filenames:
-            export_file = Path(root) / fname
-            rel = export_file.relative_to(export_pkg)
-            source_file = source_pkg / rel
-
-            if source_file.exists():
-                try:
-                    e_content = export_file.read_text(encoding="utf-8")
-                    s_content = source_file.read_text(encoding="utf-8")
-                    if e_content == s_content:
-                        results["matched"] += 1
-                    else:
-                        results["differed"] += 1
-                        results["details"].append(f"DIFF {rel}")
-                except UnicodeDecodeError:
-                    results["details"].append(f"BINARY {rel}")
-            else:
-                results["export_only"] += 1
-                results["details"].append(f"EXPORT_ONLY {rel}")
+            rels.append((Path(root) / fname).relative_to(export_pkg))
+
+    def compare(rel: Path) -> str:
+        return _compare_file(export_pkg / rel, source_pkg / rel)
+
+    outcomes = pool.map(compare, rels) if pool else map(compare, rels)
+    for rel, outcome in zip(rels, outcomes):
+        if outcome == "match":
+            results["matched"] += 1
+        elif outcome == "diff":
+            results["differed"] += 1
+            results["details"].append(f"DIFF {rel}")
+        elif outcome == "binary":
+            results["details"].append(f"BINARY {rel}")
+        else:
+            results["export_only"] += 1
+            results["details"].append(f"EXPORT_ONLY {rel}")
 
     return results
 
@@ -396,29 +788,50 @@ def main():
                         help="Path to Dolt database (default: ./doltdb)")
     parser.add_argument("--verify-against", type=Path, default=None,
                         help="Compare export against source marketplace dir")
+    parser.add_argument("--server", type=str, default=None, metavar="HOST:PORT",
+                        help="Query a running dolt sql-server instead of the dolt CLI")
+    parser.add_argument("--database", type=str, default="synaptic_canvas",
+                        help="Database name on the sql-server (default: synaptic_canvas)")
+    parser.add_argument("--user", type=str, default="root",
+                        help="sql-server user; password is read from DOLT_PASSWORD")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Skip packages unchanged since their last export "
+                             "into --output (keys kept in ~/.cache/sc-dolt-export)")
+    parser.add_argument("--link-duplicates", action="store_true",
+                        help="Hard-link files whose content was already written "
+                             "in this run instead of writing it again")
+    parser.add_argument("--jobs", type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help="Packages to export in parallel (default: 4x CPUs, max 32)")
 
     args = parser.parse_args()
 
-    doltdb = args.doltdb or Path.cwd() / "doltdb"
-    if not (doltdb / ".dolt").exists():
-        if (Path.cwd() / ".dolt").exists():
-            doltdb = Path.cwd()
-        else:
-            print(f"✗ No Dolt database at {doltdb}", file=sys.stderr)
-            sys.exit(1)
-
-    # Get package list
-    if args.packages:
-        pkg_ids = args.packages
+    if args.server:
+        conn = connect_server(args.server, args.database, args.user)
+        query: QueryFn = functools.partial(server_query, conn=conn)
     else:
-        rows = dolt_query("SELECT id FROM packages ORDER BY id;", doltdb)
-        pkg_ids = [r["id"] for r in rows]
+        doltdb = args.doltdb or Path.cwd() / "doltdb"
+        if not (doltdb / ".dolt").exists():
+            if (Path.cwd() / ".dolt").exists():
+                doltdb = Path.cwd()
+            else:
+                print(f"✗ No Dolt database at {doltdb}", file=sys.stderr)
+                sys.exit(1)
+        query = functools.partial(dolt_query, doltdb=doltdb)
+
+    # Fetch everything up front; --packages becomes an IN (...) filter
+    requested = list(dict.fromkeys(args.packages)) if args.packages else None
+    catalog = fetch_packages(requested, query, counts_only=args.dry_run)
+    pkg_ids = requested or list(catalog)
 
     if not pkg_ids:
         print("No packages found in database.", file=sys.stderr)
         sys.exit(1)
 
     print(f"▶ Exporting {len(pkg_ids)} package(s) from Dolt...")
+    for pkg_id in pkg_ids:
+        if pkg_id not in catalog:
+            print(f"✗ Package not found: {pkg_id}", file=sys.stderr)
+    found = [pkg_id for pkg_id in pkg_ids if pkg_id in catalog]
 
     if not args.dry_run:
         args.output.mkdir(parents=True, exist_ok=True)
@@ -427,15 +840,30 @@ def main():
     total_sha_ok = 0
     total_sha_fail = 0
 
-    for pkg_id in pkg_ids:
-        stats = export_package(pkg_id, args.output, doltdb, args.dry_run)
-        if "error" not in stats:
+    # sha256 -> first exported path, shared by all package workers
+    links: Optional[dict[str, str]] = {} if args.link_duplicates else None
+
+    # Separate pools: package workers block on hashes, hash workers never block
+    jobs = max(1, args.jobs)
+    with ThreadPoolExecutor(max_workers=jobs) as pool, \
+            ThreadPoolExecutor(max_workers=jobs) as hash_pool:
+        results = pool.map(
+            lambda pkg_id: export_package(catalog[pkg_id], args.output,
+                                          args.dry_run, hash_pool,
+                                          args.incremental, links),
+            found,
+        )
+        for pkg_id, stats in zip(found, results):
             total_files += stats.get("files_written", 0)
             total_sha_ok += stats.get("sha_ok", 0)
             total_sha_fail += stats.get("sha_fail", 0)
-            if not args.dry_run:
-                print(f"  ✓ {pkg_id}: {stats['files_written']} files, "
-                      f"{stats['sha_ok']} SHA verified")
+            if stats.get("dry_run"):
+                _print(stats["dry_run"])
+            elif stats.get("unchanged"):
+                _print(f"  = {pkg_id}: unchanged since last export")
+            elif not args.dry_run:
+                _print(f"  ✓ {pkg_id}: {stats['files_written']} files, "
+                       f"{stats['sha_ok']} SHA verified")
 
     if not args.dry_run:
         print(f"\n✓ Export complete: {total_files} files, "
@@ -444,8 +872,11 @@ def main():
     # Verification
     if args.verify_against and not args.dry_run:
         print(f"\n▶ Verifying against {args.verify_against}...")
-        for pkg_id in pkg_ids:
-            vr = verify_against_source(args.output, args.verify_against, pkg_id)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            reports = [verify_against_source(args.output, args.verify_against,
+                                             pkg_id, pool)
+                       for pkg_id in pkg_ids]
+        for pkg_id, vr in zip(pkg_ids, reports):
             if vr.get("status") == "source_missing":
                 print(f"  ⚠ {pkg_id}: source not found")
             else:
@@ -19,21 +19,47 @@ Usage:
     # List what would be ingested (summary only)
     python3 tools/dolt-ingest.py --list /path/to/packages/sc-manage
 
+    # Bulk-load file contents with `dolt table import` (large packages)
+    python3 tools/dolt-ingest.py --bulk /path/to/packages/sc-manage
+
+    # Re-parse all frontmatter instead of using the on-disk cache
+    python3 tools/dolt-ingest.py --no-fm-cache /path/to/packages/sc-manage
+
 Requires:
-    - Dolt CLI on PATH (uses `dolt sql -q`)
+    - Dolt CLI on PATH (feeds SQL to `dolt sql` on stdin)
     - CWD must be inside a Dolt database directory (or pass --doltdb)
     - PyYAML (pip3 install pyyaml) — falls back to basic parser
+    - orjson (pip3 install orjson) — optional, faster JSON; falls back to json
 """
 
 import argparse
+import csv
+import functools
 import hashlib
+import io
+import itertools
 import json
 import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import yaml
+    # libyaml-backed loader when PyYAML was built with it (much faster)
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ---------------------------------------------------------------------------
@@ -43,11 +69,12 @@ from typing import Any, Optional
 def load_yaml(path: Path) -> dict:
     """Load YAML file, preferring PyYAML but falling back to basic parser."""
     text = path.read_text(encoding="utf-8")
-    try:
-        import yaml
-        return yaml.safe_load(text) or {}
-    except ImportError:
+    if yaml is None:
         return _basic_yaml_parse(text)
+    return yaml.load(text, Loader=_YamlLoader) or {}
+
+
+_KV_RE = re.compile(r"^(\w[\w.-]*):\s*(.*)")
 
 
 def _basic_yaml_parse(text: str) -> dict:
@@ -70,7 +97,7 @@ def _basic_yaml_parse(text: str) -> dict:
             continue
 
         # Key: value
-        match = re.match(r"^(\w[\w.-]*):\s*(.*)", stripped)
+        match = _KV_RE.match(stripped)
         if match:
             current_key = match.group(1)
             val = match.group(2).strip()
@@ -111,15 +138,60 @@ def extract_frontmatter(content: str) -> Optional[dict]:
     m = FRONTMATTER_RE.match(content)
     if not m:
         return None
-    try:
-        import yaml
-        return yaml.safe_load(m.group(1)) or {}
-    except ImportError:
+    if yaml is None:
         return _basic_yaml_parse(m.group(1))
+    try:
+        return yaml.load(m.group(1), Loader=_YamlLoader) or {}
     except Exception:
         return None
 
 
+def fm_cache_dir() -> Optional[Path]:
+    """Default location of the parsed-frontmatter cache.
+
+    None (cache disabled) when there is no $XDG_CACHE_HOME and no home
+    directory to put it under.
+    """
+    try:
+        cache = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    except (RuntimeError, KeyError):
+        return None
+    return cache / "sc-ingest" / "fm"
+
+
+def cached_frontmatter(content: str, sha256: str,
+                       cache_dir: Optional[Path]) -> Optional[dict]:
+    """extract_frontmatter, memoized on disk by content hash.
+
+    The key is the sha256 of the content plus the parser in use, so entries
+    never go stale; they only stop being looked up.
+    """
+    if cache_dir is None:
+        return extract_frontmatter(content)
+    parser = "yaml" if yaml is not None else "basic"
+    path = cache_dir / f"{sha256}.{parser}.json"
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    fm = extract_frontmatter(content)
+    try:
+        encoded = json.dumps(fm, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return fm
+    if json.loads(encoded) != fm:
+        return fm  # e.g. non-string keys; a cache hit would differ
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(encoded, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache is best-effort
+    return fm
+
+
 # ---------------------------------------------------------------------------
 # SQL escaping
 # ---------------------------------------------------------------------------
@@ -128,15 +200,29 @@ def sql_str(val: Optional[str]) -> str:
     """Escape a string for SQL (single-quote escaping)."""
     if val is None:
         return "NULL"
-    escaped = val.replace("\\", "\\\\").replace("'", "\\'")
-    return f"'{escaped}'"
+    # Membership tests are memchr-fast; most file bodies need one or neither
+    if "\\" in val:
+        val = val.replace("\\", "\\\\")
+    if "'" in val:
+        val = val.replace("'", "\\'")
+    return f"'{val}'"
+
+
+def _json_dumps(val: Any) -> str:
+    """Compact JSON text, via orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(val, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; json copes
+    return json.dumps(val, ensure_ascii=False, separators=(",", ":"))
 
 
 def sql_json(val: Any) -> str:
     """Encode a value as a JSON SQL literal."""
     if val is None:
         return "NULL"
-    return sql_str(json.dumps(val, ensure_ascii=False))
+    return sql_str(_json_dumps(val))
 
 
 def sql_bool(val: bool) -> str:
@@ -147,39 +233,39 @@ def sql_bool(val: bool) -> str:
 # File classification
 # ---------------------------------------------------------------------------
 
+# file_type by top-level directory; anything else is config
+_DIR_TYPES = {
+    "agents": "agent",
+    "commands": "command",
+    "skills": "skill",
+    "scripts": "script",
+    "hooks": "hook",
+}
+
+# content_type by extension; anything else is text
+_EXT_TYPES = {
+    "md": "markdown",
+    "py": "python",
+    "json": "json",
+    "yaml": "yaml",
+    "yml": "yaml",
+    "sh": "shell",
+    "bash": "shell",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def classify_file(dest_path: str) -> tuple[str, str]:
     """Return (file_type, content_type) for a given dest_path."""
     p = dest_path.lower()
 
-    # file_type from directory prefix
-    if p.startswith("agents/"):
-        file_type = "agent"
-    elif p.startswith("commands/"):
-        file_type = "command"
-    elif p.startswith("skills/"):
-        file_type = "skill"
-    elif p.startswith("scripts/"):
-        file_type = "script"
-    elif p.startswith("hooks/"):
-        file_type = "hook"
-    elif p == ".claude-plugin/plugin.json" or p == "plugin.json":
-        file_type = "config"
-    else:
-        file_type = "config"
+    # file_type from directory prefix (plugin.json etc. fall through to config)
+    top, slash, _ = p.partition("/")
+    file_type = _DIR_TYPES.get(top, "config") if slash else "config"
 
     # content_type from extension
-    if p.endswith(".md"):
-        content_type = "markdown"
-    elif p.endswith(".py"):
-        content_type = "python"
-    elif p.endswith(".json"):
-        content_type = "json"
-    elif p.endswith(".yaml") or p.endswith(".yml"):
-        content_type = "yaml"
-    elif p.endswith(".sh") or p.endswith(".bash"):
-        content_type = "shell"
-    else:
-        content_type = "text"
+    _, dot, ext = p.rpartition(".")
+    content_type = _EXT_TYPES.get(ext, "text") if dot else "text"
 
     return file_type, content_type
 
@@ -199,8 +285,15 @@ SKIP_NAMES = {
 SKIP_EXACT = {"manifest.yaml"}
 
 
-def scan_package(pkg_dir: Path) -> dict:
-    """Scan a package directory and return structured data for ingestion."""
+def scan_package(pkg_dir: Path, fm_cache: Optional[Path] = None,
+                 pool: Optional[Executor] = None) -> dict:
+    """Scan a package directory and return structured data for ingestion.
+
+    When pool is given, the artifact files are read, hashed and parsed on
+    its threads. Artifacts listed in the manifest but absent on disk are
+    returned under "missing" rather than printed, so that callers scanning
+    several packages at once can report them in order.
+    """
     manifest_path = pkg_dir / "manifest.yaml"
     if not manifest_path.exists():
         raise FileNotFoundError(f"No manifest.yaml in {pkg_dir}")
@@ -244,24 +337,34 @@ def scan_package(pkg_dir: Path) -> dict:
     if options:
         pkg["options"] = options
 
-    # Scan files from artifacts section
+    # Collect files from artifacts section
     artifacts = manifest.get("artifacts", {})
-    files = []
+    listed: list[str] = []
 
     if isinstance(artifacts, dict):
         for artifact_type, paths in artifacts.items():
             if isinstance(paths, list):
-                for rel_path in paths:
-                    full_path = pkg_dir / rel_path
-                    if full_path.exists():
-                        files.append(_scan_file(pkg_id, rel_path, full_path))
-                    else:
-                        print(f"  ⚠ Missing artifact: {rel_path}", file=sys.stderr)
+                listed.extend(paths)
 
     # Also scan for .claude-plugin/plugin.json
-    plugin_json = pkg_dir / ".claude-plugin" / "plugin.json"
-    if plugin_json.exists():
-        files.append(_scan_file(pkg_id, ".claude-plugin/plugin.json", plugin_json))
+    plugin_json = ".claude-plugin/plugin.json"
+    existing = _existing_files(pkg_dir, listed + [plugin_json])
+
+    to_scan: list[tuple[str, str]] = []
+    missing: list[str] = []
+    for rel_path in listed:
+        if rel_path in existing:
+            to_scan.append((rel_path, existing[rel_path]))
+        else:
+            missing.append(rel_path)
+    if plugin_json in existing:
+        to_scan.append((plugin_json, existing[plugin_json]))
+
+    # Read, hash and parse them (map keeps manifest order)
+    def scan(item: tuple[str, str]) -> dict:
+        return _scan_file(pkg_id, item[0], item[1], fm_cache)
+
+    files = list(pool.map(scan, to_scan) if pool else map(scan, to_scan))
 
     # Dependencies
     deps = []
@@ -276,21 +379,70 @@ def scan_package(pkg_dir: Path) -> dict:
                 "dep_spec": dep_spec,
             })
 
-    return {"package": pkg, "files": files, "deps": deps}
+    return {"package": pkg, "files": files, "deps": deps, "missing": missing}
+
+
+def _existing_files(pkg_dir: Path, rel_paths: list[str]) -> dict[str, str]:
+    """Map each of rel_paths that names a file under pkg_dir to its full path.
+
+    Each parent directory is listed once with os.scandir rather than
+    stat()ing every artifact. Only those directories are read, so large
+    unrelated trees in the package (node_modules, .git) cost nothing.
+    """
+    listings: dict[str, dict[str, os.DirEntry]] = {}
+    found: dict[str, str] = {}
+    for rel_path in rel_paths:
+        parent, name = os.path.split(os.path.normpath(rel_path))
+        entries = listings.get(parent)
+        if entries is None:
+            try:
+                with os.scandir(os.path.join(pkg_dir, parent)) as it:
+                    entries = {e.name: e for e in it}
+            except OSError:
+                entries = {}
+            listings[parent] = entries
+        entry = entries.get(name)
+        if entry is not None and entry.is_file():
+            found[rel_path] = entry.path
+        elif entry is None and entries:
+            # Case-insensitive filesystems match names scandir spells differently
+            full_path = os.path.join(pkg_dir, rel_path)
+            if os.path.isfile(full_path):
+                found[rel_path] = full_path
+    return found
+
+
+def _safe_scan(pkg_dir: Path, fm_cache: Optional[Path],
+               pool: Optional[Executor]) -> tuple[Optional[dict], Optional[str]]:
+    """scan_package for a worker thread: (data, None) or (None, error)."""
+    if not pkg_dir.is_dir():
+        return None, f"Not a directory: {pkg_dir}"
+    try:
+        return scan_package(pkg_dir, fm_cache, pool), None
+    except FileNotFoundError as e:
+        return None, str(e)
 
 
-def _scan_file(pkg_id: str, rel_path: str, full_path: Path) -> dict:
+def _scan_file(pkg_id: str, rel_path: str, full_path: str | Path,
+               fm_cache: Optional[Path] = None) -> dict:
     """Read a single file and extract metadata."""
-    content = full_path.read_text(encoding="utf-8")
-    sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    with open(full_path, "rb") as fh:
+        data = fh.read()
+    # Match read_text's universal newlines so content and sha256 agree
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    sha256 = hashlib.sha256(data).hexdigest()
+    content = data.decode("utf-8")
     file_type, content_type = classify_file(rel_path)
-    is_template = "{{" in content and "}}" in content
+    # A "}}" only counts if it closes a "{{" (bails early on non-templates)
+    i = data.find(b"{{")
+    is_template = i >= 0 and data.find(b"}}", i + 2) >= 0
 
     fm = None
     fm_name = fm_desc = fm_version = fm_model = None
 
     if content_type == "markdown":
-        fm = extract_frontmatter(content)
+        fm = cached_frontmatter(content, sha256, fm_cache)
         if fm:
             fm_name = fm.get("name")
             fm_desc = fm.get("description")
@@ -313,9 +465,12 @@ def _scan_file(pkg_id: str, rel_path: str, full_path: Path) -> dict:
     }
 
 
+_REQ_RE = re.compile(r"^([\w.+-]+)\s*(.*)")
+
+
 def _parse_requirement(req: str) -> tuple[str, str]:
     """Parse 'python3' or 'git >= 2.20' into (name, spec)."""
-    match = re.match(r"^([\w.+-]+)\s*(.*)", req)
+    match = _REQ_RE.match(req)
     if match:
         return match.group(1), match.group(2).strip()
     return req, ""
@@ -325,17 +480,96 @@ def _parse_requirement(req: str) -> tuple[str, str]:
 # SQL generation
 # ---------------------------------------------------------------------------
 
-def generate_sql(data: dict) -> list[str]:
-    """Generate INSERT statements for a package."""
-    stmts = []
+# Rows per multi-row INSERT; Dolt flushes its table editor per statement
+BATCH_SIZE = 1000
+
+FILE_COLUMNS = ("package_id, dest_path, content, sha256, file_type, content_type, "
+                "is_template, fm_name, fm_description, fm_version, fm_model, frontmatter")
+DEP_COLUMNS = "package_id, dep_type, dep_name, dep_spec"
+
+
+def _file_values_parts(f: dict) -> list[str]:
+    """Render one package_files row as the pieces of a VALUES tuple."""
+    return [
+        "(", sql_str(f["package_id"]),
+        ", ", sql_str(f["dest_path"]),
+        ", ", sql_str(f["content"]),
+        ", ", sql_str(f["sha256"]),
+        ", ", sql_str(f["file_type"]),
+        ", ", sql_str(f["content_type"]),
+        ", ", sql_bool(f["is_template"]),
+        ", ", sql_str(f["fm_name"]),
+        ", ", sql_str(f["fm_description"]),
+        ", ", sql_str(f["fm_version"]),
+        ", ", sql_str(f["fm_model"]),
+        ", ", sql_json(f["frontmatter"]), ")",
+    ]
+
+
+def _dep_values_parts(d: dict) -> list[str]:
+    """Render one package_deps row as the pieces of a VALUES tuple."""
+    return [
+        "(", sql_str(d["package_id"]),
+        ", ", sql_str(d["dep_type"]),
+        ", ", sql_str(d["dep_name"]),
+        ", ", sql_str(d["dep_spec"]), ")",
+    ]
+
+
+def _truncate_row(row: list[str]) -> list[str]:
+    """Shorten a long VALUES tuple for --dry-run display."""
+    text = "".join(row)
+    if len(text) > 500:
+        return [text[:200], "\n  ... [content truncated] ..."]
+    return row
+
+
+def _batched_inserts(table: str, columns: str, rows: Iterable[list[str]],
+                     batch_size: int, preview: bool = False) -> Iterator[str]:
+    """Group VALUES tuples into multi-row INSERTs of at most batch_size rows.
+
+    Each statement is assembled with a single join over all its pieces, so
+    an escaped file body is copied into the statement once rather than once
+    per concatenation. Rows are rendered one batch at a time. With preview,
+    each long row is truncated on its own so every row stays visible.
+    """
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, batch_size)):
+        parts = [f"INSERT INTO {table} ({columns}) VALUES\n"]
+        for n, row in enumerate(batch):
+            if n:
+                parts.append(",\n")
+            parts.extend(_truncate_row(row) if preview else row)
+        parts.append(";")
+        yield "".join(parts)
+
+
+def generate_delete_sql(pkg_ids: list[str]) -> list[str]:
+    """Clear the file and dep rows of every package about to be ingested.
+
+    Run once ahead of all the packages' generate_sql, so each child table
+    is scanned once per run rather than once per package.
+    """
+    in_list = ", ".join(sql_str(pkg_id) for pkg_id in pkg_ids)
+    return [
+        f"DELETE FROM package_files WHERE package_id IN ({in_list});",
+        f"DELETE FROM package_deps WHERE package_id IN ({in_list});",
+    ]
+
+
+def generate_sql(data: dict, batch_size: int = BATCH_SIZE,
+                 preview: bool = False) -> Iterator[str]:
+    """Yield the SQL statements for a package, one at a time.
+
+    Expects generate_delete_sql to have cleared the package's old files and
+    deps; the package row itself is replaced in place. preview truncates
+    long rows for display (--dry-run); the result is not valid to execute.
+    """
     pkg = data["package"]
 
-    # DELETE existing (idempotent re-ingestion)
-    stmts.append(f"DELETE FROM packages WHERE id = {sql_str(pkg['id'])};")
-
-    # INSERT package
-    stmts.append(
-        f"INSERT INTO packages "
+    # REPLACE package (idempotent re-ingestion)
+    yield (
+        f"REPLACE INTO packages "
         f"(id, name, version, description, agent_variant, author, license, tags, "
         f"install_scope, variables, options) VALUES ("
         f"{sql_str(pkg['id'])}, "
@@ -352,58 +586,127 @@ def generate_sql(data: dict) -> list[str]:
         f");"
     )
 
-    # INSERT files
-    for f in data["files"]:
-        stmts.append(
-            f"INSERT INTO package_files "
-            f"(package_id, dest_path, content, sha256, file_type, content_type, "
-            f"is_template, fm_name, fm_description, fm_version, fm_model, frontmatter) VALUES ("
-            f"{sql_str(f['package_id'])}, "
-            f"{sql_str(f['dest_path'])}, "
-            f"{sql_str(f['content'])}, "
-            f"{sql_str(f['sha256'])}, "
-            f"{sql_str(f['file_type'])}, "
-            f"{sql_str(f['content_type'])}, "
-            f"{sql_bool(f['is_template'])}, "
-            f"{sql_str(f['fm_name'])}, "
-            f"{sql_str(f['fm_description'])}, "
-            f"{sql_str(f['fm_version'])}, "
-            f"{sql_str(f['fm_model'])}, "
-            f"{sql_json(f['frontmatter'])}"
-            f");"
-        )
+    # INSERT files and deps, batch_size rows per statement, in primary-key
+    # order so Dolt appends to its prolly tree instead of splicing chunks
+    files = sorted(data["files"], key=lambda f: (f["package_id"], f["dest_path"]))
+    deps = sorted(data["deps"], key=lambda d: (d["package_id"], d["dep_name"]))
+    yield from _batched_inserts(
+        "package_files", FILE_COLUMNS,
+        map(_file_values_parts, files), batch_size, preview,
+    )
+    yield from _batched_inserts(
+        "package_deps", DEP_COLUMNS,
+        map(_dep_values_parts, deps), batch_size, preview,
+    )
+
+
+# First column of verify rows, so they can be picked out of dolt's output
+VERIFY_TAG = "sc-verify"
+
+
+def generate_verify_sql(pkg_ids: list[str]) -> str:
+    """SELECT tagged file counts for the packages, run after the INSERTs.
+
+    One grouped query for the whole run; the LEFT JOIN keeps packages with
+    no files in the result with a count of 0.
+    """
+    in_list = ", ".join(sql_str(pkg_id) for pkg_id in pkg_ids)
+    return (
+        f"SELECT '{VERIFY_TAG}' AS tag, p.id AS package_id, "
+        f"COUNT(f.dest_path) AS file_count FROM packages p "
+        f"LEFT JOIN package_files f ON f.package_id = p.id "
+        f"WHERE p.id IN ({in_list}) GROUP BY p.id;"
+    )
 
-    # INSERT deps
-    for d in data["deps"]:
-        stmts.append(
-            f"INSERT INTO package_deps "
-            f"(package_id, dep_type, dep_name, dep_spec) VALUES ("
-            f"{sql_str(d['package_id'])}, "
-            f"{sql_str(d['dep_type'])}, "
-            f"{sql_str(d['dep_name'])}, "
-            f"{sql_str(d['dep_spec'])}"
-            f");"
-        )
 
-    return stmts
+def generate_commit_sql(msg: str) -> list[str]:
+    """Stage and commit the working set from inside the SQL session.
+
+    --skip-empty makes re-ingesting unchanged packages a no-op rather than
+    a "nothing to commit" error that would fail the whole session.
+    """
+    return [
+        "CALL DOLT_ADD('.');",
+        f"CALL DOLT_COMMIT('--skip-empty', '-m', {sql_str(msg)});",
+    ]
+
+
+def parse_verify_counts(output: str) -> dict[str, str]:
+    """Pick the tagged verify rows out of `dolt sql -r csv` output."""
+    counts = {}
+    for row in csv.reader(io.StringIO(output)):
+        if len(row) == 3 and row[0] == VERIFY_TAG:
+            counts[row[1]] = row[2]
+    return counts
 
 
 # ---------------------------------------------------------------------------
 # Dolt execution
 # ---------------------------------------------------------------------------
 
-def run_dolt_sql(stmts: list[str], doltdb: Path) -> bool:
-    """Execute SQL statements via dolt sql."""
-    combined = "\n".join(stmts)
-    result = subprocess.run(
-        ["dolt", "sql"],
-        input=combined,
-        capture_output=True,
-        text=True,
-        cwd=str(doltdb),
-    )
+def run_dolt_sql(stmts: Iterable[str], doltdb: Path) -> Optional[str]:
+    """Run SQL statements in one `dolt sql` session.
+
+    The statements are spooled to a temp file that becomes dolt's stdin, so
+    the OS feeds dolt directly instead of Python copying through a pipe.
+    Returns the session's CSV output, or None if dolt failed.
+    """
+    with tempfile.TemporaryFile() as sql, \
+            tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        for stmt in stmts:
+            sql.write(stmt.encode("utf-8"))
+            sql.write(b"\n")
+        sql.seek(0)
+        result = subprocess.run(
+            ["dolt", "sql", "-r", "csv"],
+            stdin=sql,
+            stdout=out,
+            stderr=err,
+            cwd=str(doltdb),
+        )
+        if result.returncode != 0:
+            err.seek(0)
+            stderr = err.read().decode("utf-8", errors="replace")
+            print(f"✗ Dolt SQL error:\n{stderr}", file=sys.stderr)
+            return None
+        out.seek(0)
+        return out.read().decode("utf-8", errors="replace")
+
+
+def _csv_field(val: Any) -> str:
+    """One CSV field: NULL as an empty unquoted field, anything else quoted.
+
+    csv.QUOTE_ALL would quote None too, and the importer could no longer
+    tell NULL from an empty string.
+    """
+    if val is None:
+        return ""
+    return '"' + str(val).replace('"', '""') + '"'
+
+
+def import_files_csv(files: Iterable[dict], doltdb: Path) -> bool:
+    """Bulk-load package_files rows with `dolt table import -u`.
+
+    Bypasses the SQL parser; the rows' packages must already exist.
+    """
+    columns = FILE_COLUMNS.split(", ")
+    fd, csv_path = tempfile.mkstemp(suffix=".csv", prefix="sc-ingest-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+            fh.write(",".join(columns) + "\n")
+            for f in files:
+                row = dict(f, is_template=int(f["is_template"]),
+                           frontmatter=None if f["frontmatter"] is None
+                           else _json_dumps(f["frontmatter"]))
+                fh.write(",".join(_csv_field(row[c]) for c in columns) + "\n")
+        result = subprocess.run(
+            ["dolt", "table", "import", "-u", "package_files", csv_path],
+            capture_output=True, text=True, cwd=str(doltdb),
+        )
+    finally:
+        os.unlink(csv_path)
     if result.returncode != 0:
-        print(f"✗ Dolt SQL error:\n{result.stderr}", file=sys.stderr)
+        print(f"✗ Dolt import error:\n{result.stderr}", file=sys.stderr)
         return False
     return True
 
@@ -451,8 +754,20 @@ def main():
                         help="Auto-commit after ingestion")
     parser.add_argument("--commit-msg", type=str, default=None,
                         help="Custom commit message")
+    parser.add_argument("--no-fm-cache", action="store_true",
+                        help="Don't use the parsed-frontmatter cache")
+    parser.add_argument("--jobs", type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help="Packages and files to scan in parallel "
+                             "(default: 4x CPUs, max 32)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Load package_files with `dolt table import` (faster for "
+                             "large packages; not atomic with the rest of the ingest)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help=f"Rows per multi-row INSERT (default: {BATCH_SIZE})")
 
     args = parser.parse_args()
+    batch_size = max(1, args.batch_size)
+    fm_cache = None if args.no_fm_cache else fm_cache_dir()
 
     doltdb = args.doltdb or Path.cwd() / "doltdb"
     if not (doltdb / ".dolt").exists():
@@ -463,63 +778,94 @@ def main():
             print(f"✗ No Dolt database at {doltdb}", file=sys.stderr)
             sys.exit(1)
 
-    all_sql: list[str] = []
+    scanned: list[dict] = []
     pkg_names: list[str] = []
 
-    for pkg_path_str in args.packages:
-        pkg_dir = Path(pkg_path_str).resolve()
-        if not pkg_dir.is_dir():
-            print(f"✗ Not a directory: {pkg_dir}", file=sys.stderr)
-            continue
-
-        try:
-            data = scan_package(pkg_dir)
-        except FileNotFoundError as e:
-            print(f"✗ {e}", file=sys.stderr)
-            continue
-
-        print_summary(data)
-        pkg_names.append(data["package"]["id"])
-
-        if args.list_only:
-            continue
-
-        stmts = generate_sql(data)
-
-        if args.dry_run:
-            print("\n-- SQL for", data["package"]["id"])
-            for s in stmts:
-                # Truncate content values for readability
-                if "INSERT INTO package_files" in s and len(s) > 500:
-                    print(s[:200] + "\n  ... [content truncated] ...")
-                else:
+    # Separate pools: package workers block on file scans, file workers never block
+    jobs = max(1, args.jobs)
+    pkg_dirs = [Path(p).resolve() for p in args.packages]
+    with ThreadPoolExecutor(max_workers=jobs) as pool, \
+            ThreadPoolExecutor(max_workers=jobs) as file_pool:
+        results = pool.map(
+            lambda pkg_dir: _safe_scan(pkg_dir, fm_cache, file_pool),
+            pkg_dirs,
+        )
+        for data, err in results:
+            if err:
+                print(f"✗ {err}", file=sys.stderr)
+                continue
+
+            for rel_path in data["missing"]:
+                print(f"  ⚠ Missing artifact: {rel_path}", file=sys.stderr)
+            print_summary(data)
+            pkg_names.append(data["package"]["id"])
+
+            if args.list_only:
+                continue
+
+            if args.dry_run:
+                print("\n-- SQL for", data["package"]["id"])
+                # Long rows (file contents) are truncated for readability
+                stmts = itertools.chain(generate_delete_sql([data["package"]["id"]]),
+                                        generate_sql(data, batch_size, preview=True))
+                for s in stmts:
                     print(s)
-            continue
+                continue
 
-        all_sql.extend(stmts)
+            scanned.append(data)
 
-    if args.list_only or args.dry_run or not all_sql:
+    if args.list_only or args.dry_run or not scanned:
         return
 
-    # Execute all SQL
     print(f"\n▶ Ingesting {len(pkg_names)} package(s) into Dolt...")
-    if run_dolt_sql(all_sql, doltdb):
+    by_id = sorted(scanned, key=lambda d: d["package"]["id"])
+    pkg_ids = [data["package"]["id"] for data in by_id]
+    msg = args.commit_msg or f"Ingest: {', '.join(pkg_names)}"
+
+    # With --bulk, file rows go through dolt table import instead of SQL.
+    # Empty files stay in SQL: the importer may read an empty field as NULL,
+    # which package_files.content doesn't allow.
+    bulk_files: list[dict] = []
+    sql_data = by_id
+    if args.bulk:
+        bulk_files = sorted((f for data in by_id for f in data["files"] if f["content"]),
+                            key=lambda f: (f["package_id"], f["dest_path"]))
+        sql_data = [dict(data, files=[f for f in data["files"] if not f["content"]])
+                    for data in by_id]
+
+    # SQL is generated lazily as it is spooled. One transaction around
+    # the ingest lets Dolt flush its table editors once, and makes it
+    # all-or-nothing.
+    ingest = itertools.chain(
+        ["START TRANSACTION;"],
+        generate_delete_sql(pkg_ids),
+        (s for data in sql_data for s in generate_sql(data, batch_size)),
+        ["COMMIT;"],
+    )
+    finish = itertools.chain(
+        [generate_verify_sql(pkg_ids)],
+        generate_commit_sql(msg) if args.commit else [],
+    )
+
+    if bulk_files:
+        # The import needs the package rows in place, and verify/commit need
+        # the import done: three steps instead of one session
+        ok = (run_dolt_sql(ingest, doltdb) is not None
+              and import_files_csv(bulk_files, doltdb))
+        output = run_dolt_sql(finish, doltdb) if ok else None
+    else:
+        # Verify SELECTs and the Dolt commit run in the ingest session
+        output = run_dolt_sql(itertools.chain(ingest, finish), doltdb)
+    if output is not None:
         print(f"✓ Ingested: {', '.join(pkg_names)}")
 
         # Verify
-        for name in pkg_names:
-            result = subprocess.run(
-                ["dolt", "sql", "-q",
-                 f"SELECT COUNT(*) AS file_count FROM package_files WHERE package_id = '{name}';"],
-                capture_output=True, text=True, cwd=str(doltdb),
-            )
-            print(f"  {name}: {result.stdout.strip()}")
-
-        # Auto-commit
+        counts = parse_verify_counts(output)
+        for data in scanned:
+            name = data["package"]["id"]
+            print(f"  {name}: {counts.get(name, '?')} file(s)")
+
         if args.commit:
-            msg = args.commit_msg or f"Ingest: {', '.join(pkg_names)}"
-            subprocess.run(["dolt", "add", "."], cwd=str(doltdb))
-            subprocess.run(["dolt", "commit", "-m", msg], cwd=str(doltdb))
             print(f"✓ Committed: {msg}")
     else:
         sys.exit(1)